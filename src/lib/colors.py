@@ -3,14 +3,18 @@
 Contains functions that generate data structures with preset terminal color and
 attribute string values to allow for easy use with standard print functions.
 ANSI 16 colors and basic style attributes only. By default all values are set
-to empty string if 'NO_COLOR' environment variable is set or if program is not
-running inside of interactive TTY, i.e. colors are automatically disabled
-during redirection or piping.
+to empty string if 'NO_COLOR' environment variable is set to any non-empty
+value or if program is not running inside of interactive TTY, i.e. colors are
+automatically disabled during redirection or piping.
 
 Function init_auto() is automatically executed for user convenience. Functions
 init_on() and init_off() can be used to override with specific behaviour, e.g.
 to support implementation of '--color=on/off' argument.
 
+Function combine() can be used to generate one escape sequence containing
+multiple attributes and colors, e.g. "\\033[1;91m" instead of two sequences
+"\\033[1m\\033[91m". Variable 'enabled' tells if colors are currently on.
+
 Structure:
 
     colors
@@ -62,6 +66,9 @@ Usage:
 
     print(f"{colors.fg.bright_red}Hello, 世界{colors.attr.reset}")
 
+    style = colors.combine("bold", fg="bright_red", bg="black")
+    print(f"{style}Hello, 世界{colors.attr.reset}")
+
 Author: Göran Gustafsson <gustafsson.g@gmail.com>
 License: BSD 3-Clause
 """
@@ -69,13 +76,14 @@ License: BSD 3-Clause
 # flake8: noqa: E221
 # pylint: disable=global-statement
 
+import functools
 import os
 import sys
 
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attributes:
     """Terminal style attributes."""
 
@@ -87,7 +95,7 @@ class Attributes:
     underline: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Colors:
     """Terminal background & foreground colors."""
 
@@ -110,18 +118,137 @@ class Colors:
     bright_yellow:  str = ""
 
 
+# See: https://no-color.org (any non-empty value disables colors)
+_NO_COLOR = bool(os.getenv("NO_COLOR"))
+
+# SGR parameters used to generate escape sequences in init_on().
+_ATTR_CODES = {
+    "reset":     0,
+    "bold":      1,
+    "italic":    3,
+    "underline": 4,
+    "blink":     5,
+    "reverse":   7,
+}
+_FG_CODES = {
+    "black":   30,
+    "red":     31,
+    "green":   32,
+    "yellow":  33,
+    "blue":    34,
+    "magenta": 35,
+    "cyan":    36,
+    "white":   37,
+
+    "bright_black":   90,
+    "bright_red":     91,
+    "bright_green":   92,
+    "bright_yellow":  93,
+    "bright_blue":    94,
+    "bright_magenta": 95,
+    "bright_cyan":    96,
+    "bright_white":   97,
+}
+# Background colors are always offset by 10 from foreground colors.
+_BG_CODES = {name: code + 10 for name, code in _FG_CODES.items()}
+
+# Default values, i.e. empty strings. Safe to share since instances are frozen.
+_OFF = (Attributes(), Colors(), Colors())
+
 # Using global variables to keep state without hassle for users.
-attr, bg, fg = Attributes(), Colors(), Colors()
+attr, bg, fg = _OFF
+enabled = False
+
+
+def _escapes(codes: dict) -> dict:
+    """Generate escape sequences from SGR parameters.
+
+    Arguments:
+        codes: dict containing names and SGR parameters.
+
+    Returns:
+        dict containing names and escape sequences.
+    """
+
+    return {name: sgr(code) for name, code in codes.items()}
+
+
+def sgr(*codes: int) -> str:
+    """Generate escape sequence from SGR parameters.
+
+    Arguments:
+        codes: int's containing SGR parameters, e.g. 1 and 91.
+
+    Returns:
+        str containing escape sequence, e.g. "\\033[1;91m".
+    """
+
+    return f"\033[{';'.join(map(str, codes))}m"
+
+
+def combine(*attrs: str, fg: str = "", bg: str = "") -> str:
+    """Generate one escape sequence with multiple attributes and colors.
+
+    Arguments:
+        attrs: str's containing attribute names, e.g. "bold".
+        fg: str containing foreground color name, e.g. "bright_red".
+        bg: str containing background color name, e.g. "black".
+
+    Returns:
+        str containing escape sequence, or empty string if colors are off.
+    """
+
+    codes = [_ATTR_CODES[name] for name in attrs]
+    if fg:
+        codes.append(_FG_CODES[fg])
+    if bg:
+        codes.append(_BG_CODES[bg])
+
+    if not enabled or not codes:
+        return ""
+    return sgr(*codes)
+
+
+@functools.cache
+def _detect() -> bool:
+    """Check if colors should be used.
+
+    Result is cached to avoid repeated isatty() system calls.
+
+    Returns:
+        bool that is True if program is running inside of interactive TTY and
+        'NO_COLOR' environment variable is not set (or set to empty string).
+    """
+
+    return sys.stdout.isatty() and not _NO_COLOR
+
+
+@functools.cache
+def _on() -> tuple:
+    """Generate data structures with preset attribute and color values.
+
+    Result is cached since instances are frozen, i.e. built once on first use.
+
+    Returns:
+        tuple containing Attributes, background Colors and foreground Colors.
+    """
+
+    return (
+        Attributes(**_escapes(_ATTR_CODES)),
+        Colors(**_escapes(_BG_CODES)),
+        Colors(**_escapes(_FG_CODES)),
+    )
 
 
 def init_auto():
     """Run either init_on() or init_off().
 
     If program is running inside of interactive TTY and 'NO_COLOR' environment
-    variable is not set use function init_on(), otherwise use init_off().
+    variable is not set to non-empty value use function init_on(), otherwise
+    use init_off().
     """
 
-    if sys.stdout.isatty() and os.getenv("NO_COLOR") is None:
+    if _detect():
         init_on()
     else:
         init_off()
@@ -130,61 +257,17 @@ def init_auto():
 def init_on():
     """Set data structures with preset attribute and color values."""
 
-    global attr, bg, fg
-    attr = Attributes(
-        reset     = "\033[0m",
-        bold      = "\033[1m",
-        italic    = "\033[3m",
-        underline = "\033[4m",
-        blink     = "\033[5m",
-        reverse   = "\033[7m",
-    )
-    bg = Colors(
-        black   = "\033[40m",
-        red     = "\033[41m",
-        green   = "\033[42m",
-        yellow  = "\033[43m",
-        blue    = "\033[44m",
-        magenta = "\033[45m",
-        cyan    = "\033[46m",
-        white   = "\033[47m",
-
-        bright_black   = "\033[100m",
-        bright_red     = "\033[101m",
-        bright_green   = "\033[102m",
-        bright_yellow  = "\033[103m",
-        bright_blue    = "\033[104m",
-        bright_magenta = "\033[105m",
-        bright_cyan    = "\033[106m",
-        bright_white   = "\033[107m",
-    )
-    fg = Colors(
-        black   = "\033[30m",
-        red     = "\033[31m",
-        green   = "\033[32m",
-        yellow  = "\033[33m",
-        blue    = "\033[34m",
-        magenta = "\033[35m",
-        cyan    = "\033[36m",
-        white   = "\033[37m",
-
-        bright_black   = "\033[90m",
-        bright_red     = "\033[91m",
-        bright_green   = "\033[92m",
-        bright_yellow  = "\033[93m",
-        bright_blue    = "\033[94m",
-        bright_magenta = "\033[95m",
-        bright_cyan    = "\033[96m",
-        bright_white   = "\033[97m",
-    )
+    global attr, bg, fg, enabled
+    attr, bg, fg = _on()
+    enabled = True
 
 
 def init_off():
     """Set data structures with empty attribute and color values."""
 
-    # Use default values, i.e. empty strings.
-    global attr, bg, fg
-    attr, bg, fg = Attributes(), Colors(), Colors()
+    global attr, bg, fg, enabled
+    attr, bg, fg = _OFF
+    enabled = False
 
 
 # Start automatic mode by default for user convenience.
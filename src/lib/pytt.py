@@ -15,6 +15,11 @@ License: BSD 3-Clause
 
 import os
 
+from operator import attrgetter
+
+# Appended to directory paths, plain concatenation is cheaper than f-strings.
+_GIT_SUFFIX = f"{os.sep}.git"
+
 
 # Used in "gitpl" and "gitst".
 def git_find(path: str, sub_level: bool) -> tuple:
@@ -31,18 +36,28 @@ def git_find(path: str, sub_level: bool) -> tuple:
         tuple containing Git repo directories sorted by path.
     """
 
+    # XXX: DirEntry.is_dir() uses cached scandir() info, i.e. non-directories
+    # are skipped without any extra stat() call on ".git".
+    # Using "with" to close directory file descriptors as soon as possible.
     if sub_level:
         result = []
-        for subdir in os.scandir(path):
-            if not os.path.isdir(subdir.path):
-                continue
-
-            for subdir2 in os.scandir(subdir.path):
-                if os.path.isdir(f"{subdir2.path}{os.sep}.git"):
-                    result.append(subdir2)
+        with os.scandir(path) as subdirs:
+            for subdir in subdirs:
+                if not subdir.is_dir():
+                    continue
+
+                with os.scandir(subdir.path) as subdirs2:
+                    for subdir2 in subdirs2:
+                        # Skip ".git" of parent repo without stat() call.
+                        if subdir2.name == ".git" or not subdir2.is_dir():
+                            continue
+
+                        if os.path.isdir(subdir2.path + _GIT_SUFFIX):
+                            result.append(subdir2)
     else:
-        result = [
-            subdir for subdir in os.scandir(path)
-            if os.path.isdir(f"{subdir.path}{os.sep}.git")
-        ]
-    return tuple(sorted(result, key=lambda item: item.path))
+        with os.scandir(path) as subdirs:
+            result = [
+                subdir for subdir in subdirs
+                if subdir.is_dir() and os.path.isdir(subdir.path + _GIT_SUFFIX)
+            ]
+    return tuple(sorted(result, key=attrgetter("path")))
@@ -17,9 +17,18 @@ class TestTitle(unittest.TestCase):
         #          ^^  ^^                 ^ ^      ^^ ^^ ^^
         self.assertEqual(title.title(string), expect)
 
+        # Test if words with multiple apostrophes are split into sub-words.
+        string = "rock'n'roll (don't)"
+        expect = "Rock'n'Roll (Don't)"
+        self.assertEqual(title.title(string), expect)
+
     def test_titleize(self):
         """Validate title.titleize() results."""
 
+        # Test if empty and single word input is handled.
+        self.assertEqual(title.titleize(""), "")
+        self.assertEqual(title.titleize(" the\n"), "The")
+
         # Test if first and last word gets titlecased.
         string = "the the the"
         expect = "The the The"
@@ -31,6 +40,11 @@ class TestTitle(unittest.TestCase):
         expect = f"First {lower} Last"
         self.assertEqual(title.titleize(string), expect)
 
+        # Test if custom lower tuple replaces _lowercase list.
+        string = "first the cat in last"
+        expect = "First The cat In Last"
+        self.assertEqual(title.titleize(string, ("cat",)), expect)
+
         # Test if punctuated abbreviation does not trigger new sentence.
         string = "first a.b.r. the last"
         expect = "First A.B.R. the Last"
@@ -84,6 +98,17 @@ class TestTitle(unittest.TestCase):
         #                       ^^^        ^^
         self.assertEqual(title.titleize(string), expect)
 
+    def test_titleize_many(self):
+        """Validate title.titleize_many() results."""
+
+        # Test if results match titleize() and custom lower tuple is used.
+        strings = ("the the the", "first the cat in last", "")
+        expect = [title.titleize(string, ("cat",)) for string in strings]
+        self.assertEqual(title.titleize_many(strings, ("cat",)), expect)
+        self.assertEqual(title.titleize_many(iter(strings)), [
+            title.titleize(string) for string in strings
+        ])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,7 +11,8 @@ Lowercase:
     a, an, and, as, at, but, by, en, etc, for, from,
     if, in, of, on, or, the, to, via, von, vs, with
 
-List of lowercase words can be overridden with secondary titleize() argument.
+List of lowercase words can be overridden with secondary titleize() argument,
+which must be hashable (tuple or frozenset) since results are cached.
 
 Example:
 
@@ -27,18 +28,37 @@ Usage:
     lower = ("this", "that")
     title.titleize("text", lower)
 
+    title.titleize_many(["text", "more text"])
+
+Compilation:
+
+    mypyc title.py
+
+Optional step that makes titleize() faster. Compiled extension module is
+imported instead of title.py if present, remove it to go back to pure Python.
+
 Author: Göran Gustafsson <gustafsson.g@gmail.com>
 License: BSD 3-Clause
 """
 
+from __future__ import annotations
+
+import functools
 import re
 
+from collections.abc import Iterable
+
 # XXX: Expose globally to allow for usage in test_title.py.
-_lowercase = (
+_lowercase = frozenset((
     "a", "an", "and", "as", "at", "but", "by", "en", "etc", "for", "from",
     "if", "in", "of", "on", "or", "the", "to", "via", "von", "vs", "with",
+))
+_end_sentence = frozenset(
+    (".", ",", ":", ";", "!", "?", "&", "/", "@", "+", "-")
 )
-_end_sentence = (".", ",", ":", ";", "!", "?", "&", "/", "@", "+", "-")
+
+# Regex matching every word (including sub-words), e.g. "göran's".
+_TITLE_RE = re.compile(r"\w+('\w+)?")
 
 
 def title(text: str) -> str:
@@ -54,50 +74,110 @@ def title(text: str) -> str:
         str containing titlecased text.
     """
 
-    return re.sub(
-        r"\w+('\w+)?",
-        lambda match: match.group(0).capitalize(),
-        text
-    )
+    # Skip regex if text is a single word, e.g. when called from titleize().
+    # XXX: str.isalnum() matches the same characters as \w (minus underscore).
+    if text.isalnum():
+        return text.capitalize()
+
+    # Same for single word with one apostrophe, e.g. "göran's".
+    if "'" in text:
+        head, _, tail = text.partition("'")
+        if head.isalnum() and tail.isalnum():
+            return text.capitalize()
+
+    return _TITLE_RE.sub(lambda match: match.group(0).capitalize(), text)
+
+
+def _is_abbrev(word: str) -> bool:
+    """Check if word is punctuated abbreviation, e.g. "A.Z." (or longer).
+
+    Uses string slicing instead of regex to avoid regex engine overhead.
+
+    Arguments:
+        word: str containing word to check.
+
+    Returns:
+        bool that is True if word is punctuated abbreviation.
+    """
+
+    length = len(word)
+    if length < 4 or length % 2:
+        return False
 
+    # XXX: Using str.isalpha() because str.isalnum() matches digits too.
+    return word[1::2] == "." * (length // 2) and word[::2].isalpha()
 
-def titleize(text: str, lower: tuple = _lowercase) -> str:
+
+@functools.lru_cache(maxsize=4096)
+def titleize(text: str, lower: tuple | frozenset = _lowercase) -> str:
     """Capitalize string following English title capitalization rules.
 
+    Results are cached since same titles are often repeated, e.g. artist and
+    album names in song lists.
+
     Arguments:
         text: str containing text to titleize.
-        lower: tuple containing all words to lowercase.
+        lower: tuple or frozenset containing all words to lowercase.
 
     Returns:
         str containing titleized text.
     """
 
+    # Use set for constant time lookups, custom tuples are converted once.
+    # XXX: frozenset() returns frozenset arguments as is, i.e. without copy.
+    lower_set = frozenset(lower)
+
+    # Skip loop entirely for short input, e.g. single word song titles.
     words = text.split()
-    last_word = len(words) - 1
-    skip_next = False
-    result = []
+    if not words:
+        return ""
+    if len(words) == 1:
+        return title(words[0])
 
-    # Regex matching "A.Z." (or longer) abbreviation patterns.
-    # XXX: Using [^\W\d_] because \w matches digits and underscore.
-    abbrev = re.compile(r"^([^\W\d_]{1}\.){2,}$")
+    # First word is treated as new sentence, last word is handled after loop.
+    skip_next = True
+    result: list[str] = []
 
-    for index, word in enumerate(words):
+    for word in words[:-1]:
         # Check if current iteration should be treated as new sentence.
-        skip = bool(skip_next)
-
-        # Check if next iteration should be treated as new sentence.
-        skip_next = bool(word[-1] in _end_sentence)
+        skip = skip_next
 
-        # Check if end of sentence or punctuated abbreviation.
-        if word[-1] == "." and abbrev.match(word):
-            skip_next = False
+        # Check if next iteration should be treated as new sentence, i.e. end
+        # of sentence but not punctuated abbreviation.
+        last_char = word[-1]
+        skip_next = last_char in _end_sentence and not (
+            last_char == "." and _is_abbrev(word)
+        )
 
-        # Check if new sentence, first word or last word first.
-        if skip or index in (0, last_word):
+        # Check if new sentence or first word first.
+        if skip:
             result.append(title(word))
-        elif str.lower(word) in lower:
-            result.append(word.lower())
         else:
-            result.append(title(word))
+            lowered = word.lower()
+            if lowered in lower_set:
+                result.append(lowered)
+            else:
+                result.append(title(word))
+
+    # Last word is always titlecased.
+    result.append(title(words[-1]))
+    return " ".join(result)
+
+
+def titleize_many(texts: Iterable[str],
+                  lower: tuple | frozenset = _lowercase) -> list[str]:
+    """Capitalize strings following English title capitalization rules.
+
+    Same as titleize() but for multiple strings, e.g. song lists. Custom lower
+    tuple is only converted to frozenset once for all strings.
+
+    Arguments:
+        texts: iterable containing str's to titleize.
+        lower: tuple or frozenset containing all words to lowercase.
+
+    Returns:
+        list containing titleized str's.
+    """
 
-    return str.join(" ", result)
+    lower_set = frozenset(lower)
+    return [titleize(text, lower_set) for text in texts]